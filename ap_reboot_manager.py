@@ -12,20 +12,54 @@ This script provides comprehensive AP management capabilities including:
 All necessary RUCKUS One API client code is included in this single file.
 """
 
+import io
 import os
 import sys
 import csv
 import json
 import time
 import signal
+import socket
+import hashlib
+import functools
+import heapq
 import logging
+import operator
+import threading
+import asyncio
 import argparse
+import itertools
 import configparser
 import requests
-from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional, Tuple
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
+from urllib3.util.retry import Retry
+from collections import deque
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, List, Any, Optional, Tuple, Callable, Iterator, Union
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 from pathlib import Path
-from urllib.parse import urljoin
+
+# Use orjson for decoding large API responses when available
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+# ijson lets large listing pages be parsed while they download
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# httpx is only needed for --async reboots
+try:
+    import httpx
+except ImportError:
+    httpx = None
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -43,6 +77,16 @@ COLORS = {
     'BOLD': '\033[1m'
 }
 
+# Colors are only emitted when stdout is a terminal, checked once at startup
+COLOR_OUTPUT = sys.stdout.isatty()
+
+# Escape prefix for each (color, bold) pair used by colored()
+COLOR_PREFIXES = {
+    (name, bold): (COLORS['BOLD'] if bold else '') + code
+    for name, code in COLORS.items()
+    for bold in (False, True)
+}
+
 # ========================================================================
 # RUCKUS ONE API CLIENT CODE (Previously in ruckus_one package)
 # ========================================================================
@@ -54,6 +98,59 @@ RUCKUS_REGIONS = {
     "asia": "api.asia.ruckus.cloud"
 }
 
+# Pre-encoded body for the reboot system command, sent as-is for every AP
+REBOOT_BODY = b'{"type": "REBOOT"}'
+
+# Connection pool sizing for the shared HTTP session
+POOL_CONNECTIONS = 32
+POOL_MAXSIZE = 64
+
+# TCP keepalive for pooled connections: first probe after this many idle
+# seconds, then every KEEPALIVE_INTERVAL seconds, giving up after KEEPALIVE_PROBES
+KEEPALIVE_IDLE = 30
+KEEPALIVE_INTERVAL = 10
+KEEPALIVE_PROBES = 3
+
+# Worker threads used to fetch paginated query results concurrently
+PAGE_FETCH_WORKERS = 8
+
+# Maximum pages of 1000 APs fetched for runtime status checking on import
+STATUS_PREFETCH_PAGES = 10
+
+# Sequential imports of at most this many APs look up each AP's status on
+# demand instead of pre-fetching AP pages
+LAZY_STATUS_MAX_APS = 200
+
+# Maximum APs per bulk reboot request (--bulk)
+BULK_REBOOT_SIZE = 100
+
+# CSV export write buffer, and how many pages to write between fsyncs
+EXPORT_BUFFER_SIZE = 1 << 20
+EXPORT_SYNC_PAGES = 10
+
+# Completed reboots appended to the checkpoint log between fsyncs
+CHECKPOINT_SYNC_ENTRIES = 50
+
+# Minimum seconds between periodic checkpoint saves
+CHECKPOINT_MIN_INTERVAL = 5
+
+# Export CSV columns, in the order ap_to_csv_row() emits them
+EXPORT_FIELDS = (
+    'serial_number', 'mac_address', 'model', 'firmware_version',
+    'name', 'venue_id', 'venue_name', 'ip_address', 'status'
+)
+
+# AP record keys for the export columns before ip_address, fetched in one call
+EXPORT_KEY_GETTER = operator.itemgetter(
+    'serialNumber', 'macAddress', 'model', 'firmwareVersion', 'name', 'venueId', 'venueName'
+)
+
+# Default location of the on-disk OAuth2 token cache
+TOKEN_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".ruckus_one_token.json")
+
+# Default location of the on-disk query response cache (enabled with --cache)
+RESPONSE_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "ruckus_one")
+
 # Custom exceptions
 class RuckusOneError(Exception):
     """Base exception for all RUCKUS One SDK errors."""
@@ -87,7 +184,8 @@ class ValidationError(APIError):
 class RateLimitError(APIError):
     """Exception raised when API rate limits are exceeded."""
     
-    def __init__(self, detail=None, message=None):
+    def __init__(self, detail=None, message=None, retry_after=None):
+        self.retry_after = retry_after  # Seconds the server asked us to wait, if given
         super().__init__(status_code=429, detail=detail, message=message or "Rate limit exceeded")
 
 class ServerError(APIError):
@@ -101,27 +199,134 @@ class ServerError(APIError):
             message=message or f"Server error occurred (Status: {status_code})"
         )
 
+# Status codes with a dedicated exception type (401 and 429 are handled separately)
+ERROR_MAP = {
+    400: ValidationError,
+    404: ResourceNotFoundError
+}
+
+def parse_retry_after(value: Optional[str], default: float = 1.0) -> float:
+    """Parse a Retry-After header given either as seconds or as an HTTP date."""
+    if not value:
+        return default
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return default
+
 class Auth:
     """
     Authentication handler for RUCKUS One API.
     Manages OAuth2 token generation and refreshing for API authentication.
     """
     
-    def __init__(self, client_id: str, client_secret: str, tenant_id: str, region: str = "na"):
+    def __init__(self, client_id: str, client_secret: str, tenant_id: str, region: str = "na",
+                 session: Optional[requests.Session] = None, cache_path: Optional[str] = None):
         self.client_id = client_id
         self.client_secret = client_secret
         self.tenant_id = tenant_id
         self.region = region
         self.base_url = f"https://{RUCKUS_REGIONS.get(region, RUCKUS_REGIONS['na'])}"
+        self.session = session or requests.Session()
+        self.cache_path = cache_path
+        self._cache_key = hashlib.sha256(
+            f"{client_id}:{tenant_id}:{region}".encode()
+        ).hexdigest()
         self._token = None
         self._token_expiry = datetime.now()
+        self._headers = None  # Rebuilt only when the token changes
+        self._lock = threading.Lock()
+        self._load_cached_token()
         
     def get_token(self) -> str:
         """Get a valid authentication token."""
         if self._token is None or datetime.now() >= self._token_expiry:
-            self._token, self._token_expiry = self._authenticate()
+            # Serialize refreshes so concurrent workers don't all re-authenticate
+            with self._lock:
+                if self._token is None or datetime.now() >= self._token_expiry:
+                    # Another run may have refreshed the token since we last looked
+                    if not self._load_cached_token():
+                        self._set_token(*self._authenticate())
+                        self._save_cached_token()
         return self._token
     
+    def _set_token(self, token: str, expiry: datetime) -> None:
+        """Store a new token and prebuild the request headers that carry it."""
+        self._headers = {
+            "Authorization": f"Bearer {token}",
+            "Content-Type": "application/json"
+        }
+        self._token, self._token_expiry = token, expiry
+    
+    def invalidate_token(self) -> None:
+        """Discard the current token so the next call re-authenticates."""
+        self._token = None
+        self._token_expiry = datetime.now()
+        self._save_cached_token()
+    
+    def _read_token_cache(self) -> Dict[str, Any]:
+        """Read all cached tokens, keyed by credential hash."""
+        try:
+            with open(self.cache_path, 'r') as f:
+                cache = json.load(f)
+            return cache if isinstance(cache, dict) else {}
+        except (OSError, ValueError):
+            return {}
+    
+    def _load_cached_token(self) -> bool:
+        """Load a still-valid token from the disk cache. Returns True on success."""
+        if not self.cache_path:
+            return False
+        
+        entry = self._read_token_cache().get(self._cache_key)
+        if not entry or not entry.get('access_token'):
+            return False
+        
+        try:
+            expiry = datetime.fromisoformat(entry['expiry'])
+        except (KeyError, TypeError, ValueError):
+            return False
+        
+        if datetime.now() >= expiry:
+            return False
+        
+        logger.debug("Using cached access token from %s, valid until %s", self.cache_path, entry['expiry'])
+        self._set_token(entry['access_token'], expiry)
+        return True
+    
+    def _save_cached_token(self) -> None:
+        """Persist the current token atomically with owner-only permissions."""
+        if not self.cache_path:
+            return
+        
+        cache = self._read_token_cache()
+        if self._token:
+            cache[self._cache_key] = {
+                "access_token": self._token,
+                "expiry": self._token_expiry.isoformat(),
+                "tenant": self.tenant_id
+            }
+        else:
+            cache.pop(self._cache_key, None)
+        
+        tmp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+        try:
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w') as f:
+                json.dump(cache, f)
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            logger.warning(f"Could not write token cache {self.cache_path}: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+    
     def _authenticate(self) -> Tuple[str, datetime]:
         """Authenticate with the RUCKUS One API and get a new OAuth2 token."""
         token_url = f"{self.base_url}/oauth2/token/{self.tenant_id}"
@@ -131,17 +336,17 @@ class Auth:
             "client_secret": self.client_secret
         }
         
-        logger.debug(f"Authenticating with RUCKUS One API at URL: {token_url}")
+        logger.debug("Authenticating with RUCKUS One API at URL: %s", token_url)
         
         try:
-            response = requests.post(token_url, data=auth_data)
-            logger.debug(f"Auth response status: {response.status_code}")
+            response = self.session.post(token_url, data=auth_data)
+            logger.debug("Auth response status: %s", response.status_code)
             
             if response.status_code != 200:
                 logger.error(f"Auth error response: {response.text}")
                 
             response.raise_for_status()
-            data = response.json()
+            data = json_loads(response.content)
             
             if 'access_token' not in data:
                 logger.error(f"No access token in response: {data}")
@@ -151,43 +356,183 @@ class Auth:
             expires_in = data.get('expires_in', 3600)
             expiry_time = datetime.now() + timedelta(seconds=expires_in - 300)
             
-            logger.debug(f"Successfully obtained access token, expires in {expires_in} seconds")
+            logger.debug("Successfully obtained access token, expires in %s seconds", expires_in)
             return data['access_token'], expiry_time
             
-        except requests.RequestException as e:
+        except (requests.RequestException, ValueError) as e:
             logger.exception(f"Authentication request failed: {str(e)}")
             raise AuthenticationError(f"Authentication failed: {str(e)}")
     
     def get_auth_headers(self) -> Dict[str, str]:
-        """Get the authentication headers required for API requests."""
-        return {
-            "Authorization": f"Bearer {self.get_token()}",
-            "Content-Type": "application/json"
-        }
+        """
+        Get the authentication headers required for API requests.
+        The returned dict is shared between calls and must not be modified.
+        """
+        self.get_token()
+        return self._headers
+
+class TCPTunedAdapter(HTTPAdapter):
+    """
+    HTTPAdapter whose pooled sockets disable Nagle's algorithm and enable TCP keepalive.
+    Avoids Nagle/delayed-ACK stalls on small PATCH bodies. Keepalive probes start
+    after KEEPALIVE_IDLE seconds where the platform lets the timers be set, so
+    idle pooled connections are kept open and dead ones detected between reboots;
+    elsewhere the OS default, typically two hours, applies.
+    """
+    
+    # urllib3's defaults set TCP_NODELAY; make sure it stays and add keepalive
+    socket_options = [
+        option for option in HTTPConnection.default_socket_options
+        if option[:2] != (socket.IPPROTO_TCP, socket.TCP_NODELAY)
+    ] + [
+        (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    ] + [
+        # TCP_KEEPIDLE is called TCP_KEEPALIVE on macOS
+        (socket.IPPROTO_TCP, getattr(socket, name), value)
+        for name, value in (
+            ('TCP_KEEPIDLE' if hasattr(socket, 'TCP_KEEPIDLE') else 'TCP_KEEPALIVE', KEEPALIVE_IDLE),
+            ('TCP_KEEPINTVL', KEEPALIVE_INTERVAL),
+            ('TCP_KEEPCNT', KEEPALIVE_PROBES)
+        )
+        if hasattr(socket, name)
+    ]
+    
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['socket_options'] = self.socket_options
+        super().init_poolmanager(*args, **kwargs)
+    
+    def proxy_manager_for(self, proxy, **proxy_kwargs):
+        proxy_kwargs['socket_options'] = self.socket_options
+        return super().proxy_manager_for(proxy, **proxy_kwargs)
+
+class CommandSafeRetry(Retry):
+    """
+    Transport-level retry that never resends AP system commands.
+    Reboot and bulk reboot requests are retried only by reboot_ap_with_retry()
+    and the bulk fallback, so a failed command is sent once per attempt.
+    """
+    
+    def increment(self, method=None, url=None, *args, **kwargs) -> Retry:
+        if url and url.split('?', 1)[0].lower().endswith('systemcommands'):
+            # Exhaust at once: the response or error is passed to the caller as-is
+            return Retry.increment(self.new(total=0), method, url, *args, **kwargs)
+        return super().increment(method, url, *args, **kwargs)
+
+def create_session() -> requests.Session:
+    """
+    Create an HTTP session with connection pooling and transport-level retries.
+    429 is not retried here: RateLimitError carries Retry-After to the reboot
+    drivers, which pause all workers together.
+    """
+    retry = CommandSafeRetry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=[500, 502, 503, 504],
+        allowed_methods=["GET", "POST"],
+        respect_retry_after_header=False,  # Otherwise a 429 with Retry-After is still retried
+        raise_on_status=False  # Let the final response reach _handle_error_response
+    )
+    adapter = TCPTunedAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE,
+                              max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    return session
+
+class ResponseCache:
+    """
+    On-disk cache of API responses validated with ETag / Last-Modified.
+    Entries are stored as {hash}.json, keyed by a SHA-256 of the request.
+    """
+    
+    def __init__(self, cache_dir: str):
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+    
+    def make_key(self, *parts: Any) -> str:
+        """Build a cache key from the parts that identify a request."""
+        return hashlib.sha256(json.dumps(parts, sort_keys=True).encode()).hexdigest()
+    
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached entry ({etag, last_modified, body}) for a key, if any."""
+        try:
+            with open(self._path(key), 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+    
+    def put(self, key: str, etag: Optional[str], last_modified: Optional[str], body: Any) -> None:
+        """Store a response body along with its validators."""
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump({"etag": etag, "last_modified": last_modified, "body": body}, f)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Could not write response cache entry: {e}")
 
 class RuckusOneClient:
     """Main client for interacting with the RUCKUS One API."""
     
-    def __init__(self, client_id: str, client_secret: str, tenant_id: str, region: str = "na"):
-        self.auth = Auth(client_id, client_secret, tenant_id, region)
+    def __init__(self, client_id: str, client_secret: str, tenant_id: str, region: str = "na",
+                 token_cache_path: Optional[str] = None, response_cache_dir: Optional[str] = None):
+        self.session = create_session()
+        self.auth = Auth(client_id, client_secret, tenant_id, region,
+                         session=self.session, cache_path=token_cache_path)
         self.base_url = f"https://{RUCKUS_REGIONS.get(region, RUCKUS_REGIONS['na'])}"
         self.tenant_id = tenant_id
+        self.response_cache = ResponseCache(response_cache_dir) if response_cache_dir else None
+    
+    def __enter__(self) -> "RuckusOneClient":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        """Close the underlying HTTP session and release pooled connections."""
+        self.session.close()
+    
+    def url_for(self, path: str) -> str:
+        """Build the absolute URL for an API path."""
+        # base_url never has a path component, so plain concatenation matches urljoin
+        return self.base_url + (path if path.startswith('/') else '/' + path)
         
     def request(self, method: str, path: str, params: Optional[Dict[str, Any]] = None,
-                data: Optional[Dict[str, Any]] = None, json_data: Optional[Dict[str, Any]] = None,
-                headers: Optional[Dict[str, str]] = None) -> Any:
-        """Make a request to the RUCKUS One API."""
-        url = urljoin(self.base_url, path.lstrip('/'))
+                data: Optional[Union[Dict[str, Any], bytes]] = None,
+                json_data: Optional[Dict[str, Any]] = None,
+                headers: Optional[Dict[str, str]] = None, use_cache: bool = False) -> Any:
+        """
+        Make a request to the RUCKUS One API.
+        With use_cache, the response is revalidated against the on-disk cache
+        (if enabled) and the cached body is returned on 304 Not Modified.
+        """
+        url = self.url_for(path)
         
-        logger.debug(f"Making {method} request to {url}")
+        logger.debug("Making %s request to %s", method, url)
         
-        # Get authentication headers
+        # Get authentication headers (shared dict, copied only when overridden)
         request_headers = self.auth.get_auth_headers()
         if headers:
-            request_headers.update(headers)
+            request_headers = {**request_headers, **headers}
+        
+        cache_key = cached = None
+        if use_cache and self.response_cache:
+            cache_key = self.response_cache.make_key(self.tenant_id, method.upper(), path, params, json_data)
+            cached = self.response_cache.get(cache_key)
+            if cached:
+                request_headers = dict(request_headers)
+                if cached.get('etag'):
+                    request_headers['If-None-Match'] = cached['etag']
+                if cached.get('last_modified'):
+                    request_headers['If-Modified-Since'] = cached['last_modified']
         
         try:
-            response = requests.request(
+            response = self.session.request(
                 method=method.upper(),
                 url=url,
                 params=params,
@@ -196,13 +541,27 @@ class RuckusOneClient:
                 headers=request_headers
             )
             
-            logger.debug(f"Response status: {response.status_code}")
+            logger.debug("Response status: %s", response.status_code)
+            
+            if response.status_code == 304 and cached:
+                logger.debug("Not modified, using cached response for %s", url)
+                return cached['body']
             
             # Handle response status
             if 200 <= response.status_code < 300:
                 content_type = response.headers.get('Content-Type', '')
                 if response.content and ('application/json' in content_type or 'json' in content_type):
-                    return response.json()
+                    try:
+                        result = json_loads(response.content)
+                    except ValueError as e:
+                        raise APIError(status_code=response.status_code,
+                                       message=f"Invalid JSON in response: {str(e)}")
+                    
+                    etag = response.headers.get('ETag')
+                    last_modified = response.headers.get('Last-Modified')
+                    if cache_key and (etag or last_modified):
+                        self.response_cache.put(cache_key, etag, last_modified, result)
+                    return result
                 return response.content
             
             # Handle error responses
@@ -213,6 +572,55 @@ class RuckusOneClient:
             logger.exception(f"Request failed: {str(e)}")
             raise APIError(message=f"Request failed: {str(e)}")
     
+    def stream_items(self, method: str, path: str, json_data: Optional[Dict[str, Any]] = None,
+                     key: str = 'data') -> Iterator[Any]:
+        """
+        Stream the items of the top-level `key` array of a JSON response.
+        
+        The request is sent and its status checked immediately; items are then
+        parsed incrementally from the socket with ijson as the iterator is
+        consumed, so the full body is never held in memory. Requires ijson.
+        """
+        url = self.url_for(path)
+        logger.debug("Making streaming %s request to %s", method, url)
+        
+        try:
+            response = self.session.request(
+                method=method.upper(),
+                url=url,
+                json=json_data,
+                headers=self.auth.get_auth_headers(),
+                stream=True
+            )
+        except requests.RequestException as e:
+            logger.exception(f"Request failed: {str(e)}")
+            raise APIError(message=f"Request failed: {str(e)}")
+        
+        logger.debug("Response status: %s", response.status_code)
+        
+        if not 200 <= response.status_code < 300:
+            with response:
+                logger.error(f"Request failed with status code {response.status_code}: {response.text}")
+                self._handle_error_response(response)
+        
+        # Let urllib3 undo any gzip/deflate transfer encoding while ijson reads
+        response.raw.decode_content = True
+        return self._iter_stream(response, key)
+    
+    @staticmethod
+    def _iter_stream(response: requests.Response, key: str) -> Iterator[Any]:
+        """Yield array items from a streamed response, releasing the connection when done."""
+        with response:
+            try:
+                yield from ijson.items(response.raw, f"{key}.item", use_float=True)
+            except ijson.JSONError as e:
+                raise APIError(status_code=response.status_code,
+                               message=f"Invalid JSON in streamed response: {str(e)}")
+            except (requests.RequestException, Urllib3HTTPError) as e:
+                # Connection errors while reading the body surface from urllib3, not requests
+                raise APIError(status_code=response.status_code,
+                               message=f"Streamed response failed: {str(e)}")
+    
     def _handle_error_response(self, response: requests.Response) -> None:
         """Handle error responses from the API."""
         error_detail = None
@@ -220,7 +628,7 @@ class RuckusOneClient:
         try:
             content_type = response.headers.get('Content-Type', '')
             if response.content and ('application/json' in content_type or 'json' in content_type):
-                error_data = response.json()
+                error_data = json_loads(response.content)
                 error_detail = error_data.get('message') or error_data.get('error') or error_data
         except ValueError:
             error_detail = response.text
@@ -228,13 +636,17 @@ class RuckusOneClient:
         status_code = response.status_code
         
         if status_code == 401:
+            # A cached token may have been revoked server-side; force a fresh one next time
+            self.auth.invalidate_token()
             raise AuthenticationError(f"Authentication failed: {error_detail}")
-        elif status_code == 404:
-            raise ResourceNotFoundError(detail=error_detail)
-        elif status_code == 400:
-            raise ValidationError(detail=error_detail)
-        elif status_code == 429:
-            raise RateLimitError(detail=error_detail)
+        
+        if status_code == 429:
+            raise RateLimitError(detail=error_detail,
+                                 retry_after=parse_retry_after(response.headers.get('Retry-After')))
+        
+        error_class = ERROR_MAP.get(status_code)
+        if error_class:
+            raise error_class(detail=error_detail)
         elif 500 <= status_code < 600:
             raise ServerError(status_code=status_code, detail=error_detail)
         else:
@@ -249,6 +661,166 @@ class RuckusOneClient:
         """Make a PATCH request to the API."""
         return self.request('PATCH', path, json_data=data, **kwargs)
 
+class AsyncRuckusOneClient:
+    """
+    Asynchronous client for high-volume API calls, built on httpx.
+    Shares authentication and error handling with a synchronous RuckusOneClient,
+    and multiplexes requests over HTTP/2 when the h2 package is installed.
+    """
+    
+    def __init__(self, client: RuckusOneClient, max_connections: int = POOL_MAXSIZE):
+        if httpx is None:
+            raise RuckusOneError("Async mode requires httpx: pip install 'httpx[http2]'")
+        
+        self.client = client
+        limits = httpx.Limits(max_connections=max_connections)
+        try:
+            self._http = httpx.AsyncClient(http2=True, limits=limits)
+        except ImportError:
+            logger.warning("h2 package not installed, async mode will use HTTP/1.1")
+            self._http = httpx.AsyncClient(limits=limits)
+    
+    async def __aenter__(self) -> "AsyncRuckusOneClient":
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+    
+    async def close(self) -> None:
+        """Close the underlying HTTP client."""
+        await self._http.aclose()
+    
+    async def request(self, method: str, path: str,
+                      json_data: Optional[Dict[str, Any]] = None,
+                      content: Optional[bytes] = None) -> Any:
+        """Make a request to the RUCKUS One API."""
+        url = self.client.url_for(path)
+        logger.debug("Making async %s request to %s", method, url)
+        
+        try:
+            response = await self._http.request(
+                method.upper(),
+                url,
+                json=json_data,
+                content=content,
+                headers=self.client.auth.get_auth_headers()
+            )
+        except httpx.HTTPError as e:
+            logger.error(f"Request failed: {str(e)}")
+            raise APIError(message=f"Request failed: {str(e)}")
+        
+        logger.debug("Response status: %s", response.status_code)
+        
+        if 200 <= response.status_code < 300:
+            content_type = response.headers.get('Content-Type', '')
+            if response.content and 'json' in content_type:
+                try:
+                    return json_loads(response.content)
+                except ValueError as e:
+                    raise APIError(status_code=response.status_code,
+                                   message=f"Invalid JSON in response: {str(e)}")
+            return response.content
+        
+        logger.error(f"Request failed with status code {response.status_code}: {response.text}")
+        self.client._handle_error_response(response)
+    
+    async def patch(self, path: str, data: Optional[Dict[str, Any]] = None) -> Any:
+        """Make a PATCH request to the API."""
+        return await self.request('PATCH', path, json_data=data)
+
+class TokenBucket:
+    """
+    Thread-safe token bucket for client-side request throttling.
+    Allows bursts of up to `capacity` calls, refilling at `rate` tokens per second.
+    Waits for a token end early when shutdown is requested.
+    """
+    
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> bool:
+        """
+        Block until a token is available, then consume it.
+        Returns False without a token if shutdown is requested while waiting.
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._last_refill) * self.rate)
+                self._last_refill = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return True
+                wait_time = (1 - self._tokens) / self.rate
+            if shutdown_event.wait(wait_time):
+                return False
+
+def get_page_count(result: Dict[str, Any], page_size: int) -> Optional[int]:
+    """Read the total number of pages from a query response, if it reports one."""
+    pagination = result.get('pagination') or {}
+    total_pages = pagination.get('totalPages') or result.get('totalPages')
+    if total_pages:
+        return total_pages
+    
+    total_elements = pagination.get('totalElements', result.get('totalCount'))
+    if total_elements is None:
+        return None
+    return (total_elements + page_size - 1) // page_size
+
+def iter_all_pages(fetch_page: Callable[[int], Dict[str, Any]], page_size: int,
+                   max_workers: int = PAGE_FETCH_WORKERS,
+                   max_pages: Optional[int] = None) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Yield the data of every page of a paginated query, in page order.
+    
+    Page 0 is fetched first to learn the total; remaining pages are fetched
+    concurrently, with at most max_workers pages in flight or waiting to be
+    consumed so memory stays bounded however large the result set is.
+    At most max_pages pages are fetched when it is given.
+    """
+    first_page = fetch_page(0)
+    page_data = first_page.get('data', [])
+    total_pages = get_page_count(first_page, page_size)
+    yield page_data
+    
+    if total_pages is None:
+        # No totals reported: walk pages until a short one comes back
+        page = 1
+        while len(page_data) >= page_size and (max_pages is None or page < max_pages):
+            page_data = fetch_page(page).get('data', [])
+            yield page_data
+            page += 1
+        return
+    
+    if max_pages is not None:
+        total_pages = min(total_pages, max_pages)
+    if total_pages <= 1:
+        return
+    
+    logger.debug("Fetching %d remaining pages with %d workers", total_pages - 1, max_workers)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = deque()
+        next_page = 1
+        try:
+            while next_page < total_pages or pending:
+                while next_page < total_pages and len(pending) < max_workers:
+                    pending.append(executor.submit(fetch_page, next_page))
+                    next_page += 1
+                yield pending.popleft().result().get('data', [])
+        finally:
+            # Consumer stopped early or a page failed: don't fetch what's left
+            for future in pending:
+                future.cancel()
+
+def fetch_all_pages(fetch_page: Callable[[int], Dict[str, Any]], page_size: int,
+                    max_workers: int = PAGE_FETCH_WORKERS) -> List[Dict[str, Any]]:
+    """Fetch every page of a paginated query and return the combined data in page order."""
+    return [item for page_data in iter_all_pages(fetch_page, page_size, max_workers) for item in page_data]
+
 class Venues:
     """Venues API module."""
     
@@ -263,20 +835,41 @@ class Venues:
             "sortOrder": sort_order.upper()
         }
         
-        logger.debug(f"Listing venues with parameters: {query_data}")
+        logger.debug("Listing venues with parameters: %s", query_data)
         try:
-            result = self.client.post("/venues/query", data=query_data)
-            logger.debug(f"List venues response keys: {list(result.keys()) if result else 'No result'}")
+            result = self.client.post("/venues/query", data=query_data, use_cache=True)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("List venues response keys: %s", list(result.keys()) if result else 'No result')
             return result
         except Exception as e:
             logger.exception(f"Error listing venues: {str(e)}")
             raise
+    
+    def list_all(self, page_size: int = 1000, sort_order: str = "ASC",
+                 max_workers: int = PAGE_FETCH_WORKERS) -> List[Dict[str, Any]]:
+        """List all venues, fetching pages after the first concurrently."""
+        return fetch_all_pages(
+            lambda page: self.list(page_size=page_size, page=page, sort_order=sort_order),
+            page_size,
+            max_workers=max_workers
+        )
+    
+    def get_map(self, page_size: int = 1000) -> Dict[str, Dict[str, Any]]:
+        """Return all venues keyed by venue ID."""
+        return {venue['id']: venue for venue in self.list_all(page_size=page_size) if venue.get('id')}
 
 class AccessPoints:
     """Access Points API module."""
     
-    def __init__(self, client: RuckusOneClient):
+    def __init__(self, client: RuckusOneClient, rate_limiter: Optional[TokenBucket] = None):
         self.client = client
+        self.rate_limiter = rate_limiter
+        self._bulk_supported = True
+    
+    def _throttle(self) -> None:
+        """Wait for the rate limiter, if one is configured."""
+        if self.rate_limiter:
+            self.rate_limiter.acquire()
     
     def list(self, query_data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """List access points with optional filtering."""
@@ -290,25 +883,91 @@ class AccessPoints:
         if "sortOrder" in query_data:
             query_data["sortOrder"] = query_data["sortOrder"].upper()
         
-        logger.debug(f"Querying APs with data: {query_data}")
+        logger.debug("Querying APs with data: %s", query_data)
         
+        self._throttle()
         try:
-            result = self.client.post("/venues/aps/query", data=query_data)
-            logger.debug(f"AP query result keys: {list(result.keys()) if result else 'No result'}")
+            result = self.client.post("/venues/aps/query", data=query_data, use_cache=True)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("AP query result keys: %s", list(result.keys()) if result else 'No result')
             return result
         except Exception as e:
             logger.exception(f"Error querying APs: {str(e)}")
             raise
     
+    def stream(self, query_data: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """Stream the access points of one query page, parsing them as they arrive."""
+        self._throttle()
+        return self.client.stream_items('POST', "/venues/aps/query", json_data=query_data)
+    
+    def iter_pages(self, page_size: int = 1000, sort_order: str = "ASC",
+                   max_workers: int = PAGE_FETCH_WORKERS,
+                   max_pages: Optional[int] = None) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yield pages of access points in order, prefetching upcoming pages concurrently.
+        
+        When ijson is installed (and the response cache is off), pages after the
+        first are parsed incrementally in the fetching thread, so a page's raw
+        body and its parsed records are never both held in memory.
+        """
+        # Page 0 always goes through list() since it carries the pagination totals
+        stream_pages = ijson is not None and self.client.response_cache is None
+        
+        def fetch_page(page: int) -> Dict[str, Any]:
+            query_data = {"pageSize": page_size, "page": page, "sortOrder": sort_order.upper()}
+            if stream_pages and page > 0:
+                return {'data': list(self.stream(query_data))}
+            return self.list(query_data)
+        
+        return iter_all_pages(fetch_page, page_size, max_workers=max_workers, max_pages=max_pages)
+    
+    def get(self, serial_number: str) -> Optional[Dict[str, Any]]:
+        """Get a single access point by serial number, or None if it is not found."""
+        result = self.list({
+            "pageSize": 10,
+            "page": 0,
+            "sortOrder": "ASC",
+            "filters": {"serialNumber": [serial_number]}
+        })
+        aps = result.get('data', [])
+        for ap in aps:
+            if ap.get('serialNumber') == serial_number:
+                return ap
+        if aps:
+            # Other APs came back, so the serial number filter was not applied
+            raise APIError(detail=f"serialNumber filter ignored when looking up AP {serial_number}")
+        return None
+    
     def reboot(self, venue_id: str, serial_number: str) -> Dict[str, Any]:
         """Reboot an access point."""
+        self._throttle()
         try:
-            data = {"type": "REBOOT"}
-            return self.client.patch(f"/venues/{venue_id}/aps/{serial_number}/systemCommands", data=data)
+            # Send the pre-encoded body; the auth headers already declare JSON content
+            return self.client.request('PATCH', f"/venues/{venue_id}/aps/{serial_number}/systemCommands",
+                                       data=REBOOT_BODY)
         except ResourceNotFoundError:
             raise ResourceNotFoundError(
                 message=f"AP with serial number {serial_number} not found in venue {venue_id}"
             )
+    
+    def reboot_many(self, venue_id: str, serial_numbers: List[str]) -> bool:
+        """
+        Reboot several access points in one venue with a single bulk request.
+        Returns False if the bulk endpoint is unavailable, so callers can fall
+        back to per-AP reboots; once rejected, it is not tried again.
+        """
+        if not self._bulk_supported:
+            return False
+        
+        self._throttle()
+        try:
+            self.client.post(f"/venues/{venue_id}/aps/bulkSystemCommands",
+                             data={"serials": serial_numbers, "type": "REBOOT"})
+            return True
+        except (ResourceNotFoundError, ValidationError) as e:
+            logger.info(f"Bulk reboot not available ({e}), falling back to per-AP reboots")
+            self._bulk_supported = False
+            return False
 
 # ========================================================================
 # ORIGINAL AP REBOOT MANAGER FUNCTIONS
@@ -316,54 +975,85 @@ class AccessPoints:
 
 def colored(text: str, color: str, bold: bool = False) -> str:
     """Apply color to text for terminal output."""
-    if not sys.stdout.isatty():
+    if not COLOR_OUTPUT:
         return text  # No colors if not a terminal
-    color_code = COLORS.get(color.upper(), '')
-    bold_code = COLORS['BOLD'] if bold else ''
-    return f"{bold_code}{color_code}{text}{COLORS['RESET']}"
+    prefix = COLOR_PREFIXES.get((color, bold))
+    if prefix is None:
+        prefix = COLOR_PREFIXES.get((color.upper(), bold), COLORS['BOLD'] if bold else '')
+    return f"{prefix}{text}{COLORS['RESET']}"
+
+@functools.lru_cache(maxsize=None)
+def is_operational_status(status: str) -> bool:
+    """Check whether an AP status is operational; a tenant only reports a handful of distinct statuses."""
+    return 'Operational' in status or status.startswith('2_')
 
 def countdown_with_dots(seconds: int, prefix: str = "Waiting"):
-    """Show countdown with dots, printing 10s markers."""
+    """
+    Show countdown with dots, printing 10s markers.
+    Sleeps in 10s ticks on the shutdown event, writing each tick's dots at once.
+    """
     if seconds <= 0:
         return
     
-    print(f"{prefix}: ", end='', flush=True)
+    sys.stdout.write(f"{prefix}: ")
+    sys.stdout.flush()
     
-    for i in range(1, seconds + 1):
-        if shutdown_requested:
-            print(" [Interrupted]")
-            break
-            
-        time.sleep(1)
+    elapsed = 0
+    while elapsed < seconds:
+        tick = min(10, seconds - elapsed)
+        if shutdown_event.wait(tick):
+            sys.stdout.write(" [Interrupted]\n")
+            sys.stdout.flush()
+            return
         
-        if i % 10 == 0:
-            print(str(i), end='', flush=True)
+        elapsed += tick
+        if elapsed % 10 == 0:
+            segment = "." * (tick - 1) + str(elapsed)
         else:
-            print(".", end='', flush=True)
-        
-        if i % 50 == 0 and i < seconds:
-            print("\n          ", end='', flush=True)
-    
-    print()  # Final newline
+            segment = "." * tick
+        if elapsed % 50 == 0 and elapsed < seconds:
+            segment += "\n          "
+        sys.stdout.write(segment)
+        sys.stdout.flush()
+    
+    sys.stdout.write("\n")
+    sys.stdout.flush()
 
-# Global flag for graceful shutdown
-shutdown_requested = False
+# Set on the first CTRL+C for graceful shutdown; waits on it wake immediately
+shutdown_event = threading.Event()
 
 def signal_handler(signum, frame):
     """Handle shutdown signals gracefully."""
-    global shutdown_requested
-    if shutdown_requested:
+    if shutdown_event.is_set():
         logger.warning("Force shutdown requested. Exiting immediately...")
         sys.exit(1)
-    shutdown_requested = True
+    shutdown_event.set()
     logger.info("Shutdown requested. Press CTRL+C again to force stop...")
 
+class SecondCacheFormatter(logging.Formatter):
+    """Formatter that renders the timestamp once per second and reuses it for later records."""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # (second, formatted timestamp), swapped as one tuple so threads never see a torn pair
+        self._time_cache = (None, '')
+    
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        if not datefmt:
+            return super().formatTime(record, datefmt)  # Default format includes milliseconds
+        second = int(record.created)
+        cached_second, cached_time = self._time_cache
+        if second != cached_second:
+            cached_time = time.strftime(datefmt, self.converter(second))
+            self._time_cache = (second, cached_time)
+        return cached_time
+
 def setup_logging(log_level: str = "INFO", log_file: Optional[str] = None):
     """Set up logging configuration."""
     level = getattr(logging, log_level.upper(), logging.INFO)
     
     console_handler = logging.StreamHandler()
-    console_formatter = logging.Formatter(
+    console_formatter = SecondCacheFormatter(
         '%(asctime)s - %(levelname)s - %(message)s',
         datefmt='%Y-%m-%d %H:%M:%S'
     )
@@ -373,7 +1063,7 @@ def setup_logging(log_level: str = "INFO", log_file: Optional[str] = None):
     
     if log_file:
         file_handler = logging.FileHandler(log_file)
-        file_formatter = logging.Formatter(
+        file_formatter = SecondCacheFormatter(
             '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
             datefmt='%Y-%m-%d %H:%M:%S'
         )
@@ -382,88 +1072,54 @@ def setup_logging(log_level: str = "INFO", log_file: Optional[str] = None):
     
     logging.basicConfig(level=level, handlers=handlers)
 
-def load_config(config_path: str) -> Dict[str, str]:
-    """Load configuration from config.ini file."""
+@functools.lru_cache(maxsize=8)
+def _parse_config(config_path: str, mtime_ns: int) -> Tuple[Tuple[str, Optional[str]], ...]:
+    """Parse the credentials from a config file; the mtime keys the cache so edits are picked up."""
     config = configparser.ConfigParser()
-    
-    if not os.path.exists(config_path):
-        raise FileNotFoundError(f"Configuration file not found: {config_path}")
-    
     config.read(config_path)
     
     if 'credentials' in config:
-        return {
-            'client_id': config['credentials'].get('client_id'),
-            'client_secret': config['credentials'].get('client_secret'),
-            'tenant_id': config['credentials'].get('tenant_id'),
-            'region': config['credentials'].get('region', 'na')
-        }
+        section = config['credentials']
     elif 'auth' in config:
-        return {
-            'client_id': config['auth'].get('client_id'),
-            'client_secret': config['auth'].get('client_secret'),
-            'tenant_id': config['auth'].get('tenant_id'),
-            'region': config['auth'].get('region', 'na')
-        }
+        section = config['auth']
     else:
         raise ValueError("No credentials or auth section found in config file")
+    
+    return (
+        ('client_id', section.get('client_id')),
+        ('client_secret', section.get('client_secret')),
+        ('tenant_id', section.get('tenant_id')),
+        ('region', section.get('region', 'na'))
+    )
 
-def get_all_aps(ap_module: AccessPoints, venues_dict: Dict[str, str]) -> List[Dict[str, Any]]:
-    """Fetch all APs with proper pagination."""
-    all_aps = []
-    page = 0
-    page_size = 100
-    total_pages = None
+def load_config(config_path: str) -> Dict[str, str]:
+    """Load configuration from config.ini file, reusing the parse while the file is unchanged."""
+    if not os.path.exists(config_path):
+        raise FileNotFoundError(f"Configuration file not found: {config_path}")
     
+    config_path = os.path.abspath(config_path)
+    return dict(_parse_config(config_path, os.stat(config_path).st_mtime_ns))
+
+def iter_aps(ap_module: AccessPoints, venues_dict: Dict[str, str]) -> Iterator[List[Dict[str, Any]]]:
+    """Yield APs page by page, annotated with venue names."""
     logger.info("Starting to fetch all APs from tenant...")
+    total = 0
     
-    while True:
-        if shutdown_requested:
-            logger.warning("Shutdown requested during AP fetch")
-            break
-            
-        query_data = {
-            "pageSize": page_size,
-            "page": page,
-            "sortOrder": "ASC"
-        }
+    for page_data in ap_module.iter_pages():
+        # Add venue name to each AP
+        for ap in page_data:
+            venue_id = ap.get('venueId', '')
+            ap['venueName'] = venues_dict.get(venue_id, 'Unknown')
         
-        try:
-            result = ap_module.list(query_data)
-            data = result.get('data', [])
-            
-            # Add venue name to each AP
-            for ap in data:
-                venue_id = ap.get('venueId', '')
-                ap['venueName'] = venues_dict.get(venue_id, 'Unknown')
-            
-            all_aps.extend(data)
-            
-            # Check pagination info
-            pagination = result.get('pagination', {})
-            total_elements = pagination.get('totalElements', 0)
-            
-            if total_pages is None and total_elements > 0:
-                total_pages = (total_elements + page_size - 1) // page_size
-                logger.info(f"Total APs to fetch: {total_elements} across {total_pages} pages")
-            
-            logger.info(f"Fetched page {page + 1}/{total_pages or '?'} - Got {len(data)} APs (Total so far: {len(all_aps)})")
-            
-            # Check if we have more pages
-            if len(data) < page_size:
-                break
-                
-            page += 1
-            
-        except Exception as e:
-            logger.error(f"Error fetching APs on page {page}: {e}")
-            page += 1
-            if page > 100:  # Safety limit
-                logger.error("Reached safety limit of 100 pages, stopping")
-                break
+        total += len(page_data)
+        logger.info("Fetched %d APs (Total so far: %d)", len(page_data), total)
+        yield page_data
+        
+        if shutdown_event.is_set():
+            logger.warning("Shutdown requested during AP fetch")
+            return
     
-    logger.info(f"Completed fetching APs. Total: {len(all_aps)}")
-    return all_aps
+    logger.info(f"Completed fetching APs. Total: {total}")
 
 def get_all_venues(venues_module: Venues) -> Dict[str, str]:
     """Get all venues and return a dictionary mapping venue ID to venue name."""
@@ -471,14 +1127,10 @@ def get_all_venues(venues_module: Venues) -> Dict[str, str]:
     venues_dict = {}
     
     try:
-        venues_result = venues_module.list(page_size=100, page=0, sort_order="ASC")
-        venues_list = venues_result.get('data', [])
-        
-        for venue in venues_list:
-            venue_id = venue.get('id')
-            venue_name = venue.get('name', 'Unknown')
-            if venue_id:
-                venues_dict[venue_id] = venue_name
+        venues_dict = {
+            venue_id: venue.get('name', 'Unknown')
+            for venue_id, venue in venues_module.get_map().items()
+        }
         
         logger.info(f"Found {len(venues_dict)} venues")
         
@@ -487,8 +1139,32 @@ def get_all_venues(venues_module: Venues) -> Dict[str, str]:
     
     return venues_dict
 
+def ap_to_csv_row(ap: Dict[str, Any]) -> Tuple[Any, ...]:
+    """Build an export CSV row from an AP record, with values in EXPORT_FIELDS order."""
+    try:
+        # Fast path for complete records
+        return EXPORT_KEY_GETTER(ap) + (ap.get('networkStatus', {}).get('ipAddress', ''), ap['status'])
+    except KeyError:
+        pass
+    
+    # Extract nested network status info
+    network_status = ap.get('networkStatus', {})
+    ip_address = network_status.get('ipAddress', '')
+    
+    return (
+        ap.get('serialNumber', ''),
+        ap.get('macAddress', ''),
+        ap.get('model', ''),
+        ap.get('firmwareVersion', ''),
+        ap.get('name', ''),
+        ap.get('venueId', ''),
+        ap.get('venueName', ''),
+        ip_address,
+        ap.get('status', '')
+    )
+
 def export_aps_to_csv(client: RuckusOneClient, output_file: Optional[str] = None) -> str:
-    """Export all APs to a CSV file."""
+    """Export all APs to a CSV file, writing each page as it arrives."""
     # Initialize modules
     venues_module = Venues(client)
     ap_module = AccessPoints(client)
@@ -496,10 +1172,15 @@ def export_aps_to_csv(client: RuckusOneClient, output_file: Optional[str] = None
     # Get venues first for name mapping
     venues_dict = get_all_venues(venues_module)
     
-    # Get all APs with pagination
-    all_aps = get_all_aps(ap_module, venues_dict)
+    # Stream APs page by page; only the current page is held in memory
+    pages = iter_aps(ap_module, venues_dict)
+    try:
+        first_page = next(pages, [])
+    except Exception as e:
+        logger.error(f"Error fetching APs: {e}")
+        first_page = []
     
-    if not all_aps:
+    if not first_page:
         logger.warning("No APs found to export")
         return None
     
@@ -508,43 +1189,83 @@ def export_aps_to_csv(client: RuckusOneClient, output_file: Optional[str] = None
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         output_file = f"ap_export_{timestamp}.csv"
     
-    # Define CSV columns
-    fieldnames = [
-        'serial_number', 'mac_address', 'model', 'firmware_version',
-        'name', 'venue_id', 'venue_name', 'ip_address', 'status'
-    ]
-    
     # Write to CSV
-    logger.info(f"Writing {len(all_aps)} APs to {output_file}...")
+    logger.info(f"Writing APs to {output_file}...")
+    written = 0
     
-    with open(output_file, 'w', newline='') as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
+    try:
+        second_page = next(pages, None)
+    except Exception as e:
+        logger.error(f"Error fetching APs: {e}")
+        raise
+    
+    if second_page is None:
+        # Everything fit in one page: render in memory and write it in a single call
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(EXPORT_FIELDS)
+        writer.writerows(map(ap_to_csv_row, first_page))
+        with open(output_file, 'w', newline='') as csvfile:
+            csvfile.write(buffer.getvalue())
+        written = len(first_page)
         
-        for i, ap in enumerate(all_aps):
-            if i > 0 and i % 100 == 0:
-                logger.debug(f"Written {i}/{len(all_aps)} APs to CSV")
-            
-            # Extract nested network status info
-            network_status = ap.get('networkStatus', {})
-            ip_address = network_status.get('ipAddress', '')
-            
-            row = {
-                'serial_number': ap.get('serialNumber', ''),
-                'mac_address': ap.get('macAddress', ''),
-                'model': ap.get('model', ''),
-                'firmware_version': ap.get('firmwareVersion', ''),
-                'name': ap.get('name', ''),
-                'venue_id': ap.get('venueId', ''),
-                'venue_name': ap.get('venueName', ''),
-                'ip_address': ip_address,
-                'status': ap.get('status', '')
-            }
-            writer.writerow(row)
+        logger.info(f"Successfully exported {written} APs to {output_file}")
+        return output_file
     
-    logger.info(f"Successfully exported {len(all_aps)} APs to {output_file}")
+    with open(output_file, 'w', newline='', buffering=EXPORT_BUFFER_SIZE) as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(EXPORT_FIELDS)
+        
+        try:
+            all_pages = itertools.chain([first_page, second_page], pages)
+            for page_number, page_data in enumerate(all_pages, start=1):
+                writer.writerows(map(ap_to_csv_row, page_data))
+                # One write per page so a partial export survives an interruption
+                csvfile.flush()
+                if page_number % EXPORT_SYNC_PAGES == 0:
+                    os.fsync(csvfile.fileno())
+                written += len(page_data)
+                logger.debug("Written %d APs to CSV", written)
+        except Exception as e:
+            logger.error(f"Export incomplete, {written} APs written to {output_file}: {e}")
+            raise
+    
+    logger.info(f"Successfully exported {written} APs to {output_file}")
     return output_file
 
+def iter_reboot_csv(csv_file: str) -> Iterator[Dict[str, str]]:
+    """
+    Yield reboot CSV rows lazily, skipping repeated (venue_id, serial_number) rows.
+    The first occurrence of each AP is kept, in file order.
+    """
+    seen = set()
+    with open(csv_file, 'r', newline='') as csvfile:
+        for row in csv.DictReader(csvfile):
+            key = (row.get('venue_id', ''), row.get('serial_number', ''))
+            if key not in seen:
+                seen.add(key)
+                yield row
+
+def scan_reboot_csv(csv_file: str) -> List[str]:
+    """
+    Scan the reboot CSV once for the serial numbers of the APs iter_reboot_csv() yields.
+    Only the serials are kept, so the rows themselves are never all held in memory.
+    """
+    serials = []
+    seen = set()
+    total = 0
+    with open(csv_file, 'r', newline='') as csvfile:
+        for row in csv.DictReader(csvfile):
+            total += 1
+            key = (row.get('venue_id', ''), row.get('serial_number', ''))
+            if key not in seen:
+                seen.add(key)
+                serials.append(key[1])
+    
+    if total > len(serials):
+        logger.warning(f"Ignoring {total - len(serials)} duplicate AP rows in {csv_file}")
+    return serials
+
 def load_checkpoint(checkpoint_file: str) -> Dict[str, Any]:
     """Load checkpoint data from file."""
     if os.path.exists(checkpoint_file):
@@ -556,51 +1277,472 @@ def load_checkpoint(checkpoint_file: str) -> Dict[str, Any]:
     return {}
 
 def save_checkpoint(checkpoint_file: str, data: Dict[str, Any]):
-    """Save checkpoint data to file."""
+    """Save checkpoint data to file atomically, so an interrupted save keeps the previous one."""
+    tmp_path = f"{checkpoint_file}.tmp"
     try:
-        with open(checkpoint_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f, separators=(',', ':'))
+        os.replace(tmp_path, checkpoint_file)
     except Exception as e:
         logger.error(f"Could not save checkpoint: {e}")
 
+class CheckpointLog:
+    """
+    Append-only log of serial numbers whose reboot was accepted.
+    One line per AP is written with os.write, so recording a reboot costs
+    a single small write instead of rewriting the checkpoint file.
+    """
+    
+    def __init__(self, path: str, truncate: bool = False):
+        self.path = path
+        flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT
+        if truncate:
+            flags |= os.O_TRUNC
+        self._fd = os.open(path, flags, 0o644)
+        self._unsynced = 0
+    
+    @staticmethod
+    def load(path: str) -> List[str]:
+        """Return the logged serial numbers, oldest first."""
+        try:
+            return Path(path).read_text().splitlines()
+        except FileNotFoundError:
+            return []
+        except OSError as e:
+            logger.warning(f"Could not load checkpoint log: {e}")
+            return []
+    
+    def record(self, serial_number: str) -> None:
+        """Append a completed serial number, syncing every CHECKPOINT_SYNC_ENTRIES."""
+        if self._fd is None:
+            return
+        os.write(self._fd, f"{serial_number}\n".encode())
+        self._unsynced += 1
+        if self._unsynced >= CHECKPOINT_SYNC_ENTRIES:
+            self.sync()
+    
+    def sync(self) -> None:
+        """Flush logged entries to disk."""
+        if self._fd is not None and self._unsynced:
+            os.fsync(self._fd)
+            self._unsynced = 0
+    
+    def close(self) -> None:
+        """Sync and close the log file."""
+        if self._fd is not None:
+            self.sync()
+            os.close(self._fd)
+            self._fd = None
+
+def record_reboot_result(stats: Dict[str, Any], ap_name: str, serial_number: str,
+                         venue_id: str, success: bool, error_msg: Optional[str]):
+    """Log a reboot outcome and add it to the run statistics."""
+    if success:
+        logger.info("Successfully initiated reboot for AP %s", colored(serial_number, 'GREEN'))
+        stats['success'] += 1
+        stats['success_aps'].append({
+            'serial_number': serial_number,
+            'name': ap_name,
+            'venue_id': venue_id
+        })
+    else:
+        logger.error("Failed to reboot AP %s: %s", colored(serial_number, 'RED'), error_msg)
+        stats['failed'] += 1
+        stats['failed_aps'].append({
+            'serial_number': serial_number,
+            'name': ap_name,
+            'error': error_msg
+        })
+
+# Error returned by reboot_ap_with_retry() when shutdown interrupts a retry wait;
+# the AP was not rebooted and is left for --resume
+SHUTDOWN_ERROR = "shutdown"
+
 def reboot_ap_with_retry(ap_module: AccessPoints, venue_id: str, serial_number: str, 
-                         max_retries: int = 3) -> Tuple[bool, str]:
-    """Reboot an AP with retry logic."""
+                         max_retries: int = 3,
+                         on_rate_limit: Optional[Callable[[RateLimitError], None]] = None,
+                         pause: Optional["RateLimitPause"] = None) -> Tuple[bool, str]:
+    """
+    Reboot an AP with retry logic.
+    When a shared RateLimitPause is given, a 429 pauses all workers for the
+    server's Retry-After instead of each worker backing off on its own, and
+    on_rate_limit is called only by the worker that starts the pause, so one
+    burst of 429s is reported once. Without a pause it is called on every 429.
+    Returns (False, SHUTDOWN_ERROR) if shutdown is requested while waiting to retry.
+    """
     for attempt in range(max_retries):
+        if pause:
+            pause.wait()
+        if shutdown_event.is_set():
+            return False, SHUTDOWN_ERROR
         try:
             result = ap_module.reboot(venue_id, serial_number)
             return True, None
         except Exception as e:
+            rate_limited = isinstance(e, RateLimitError)
+            if rate_limited and on_rate_limit and not pause:
+                on_rate_limit(e)
             error_msg = str(e)
             if attempt < max_retries - 1:
+                if rate_limited and pause:
+                    if pause.pause(e.retry_after) and on_rate_limit:
+                        on_rate_limit(e)
+                    if shutdown_event.is_set():
+                        return False, SHUTDOWN_ERROR
+                    continue
                 wait_time = 2 ** attempt  # Exponential backoff
+                if rate_limited and e.retry_after:
+                    wait_time = max(wait_time, e.retry_after)
                 logger.warning(f"Reboot failed (attempt {attempt + 1}/{max_retries}), retrying in {wait_time}s: {error_msg}")
-                time.sleep(wait_time)
+                if shutdown_event.wait(wait_time):
+                    return False, SHUTDOWN_ERROR
             else:
                 logger.error(f"Reboot failed after {max_retries} attempts: {error_msg}")
                 return False, error_msg
     
     return False, "Unknown error"
 
+class ConcurrencyLimiter:
+    """
+    Bounds the number of in-flight API calls.
+    The bound is halved whenever the API reports a rate limit, down to one,
+    and grows back by one after each run of `limit` successful calls.
+    """
+    
+    def __init__(self, limit: int):
+        self.limit = max(1, limit)
+        self.max_limit = self.limit
+        self._active = 0
+        self._successes = 0
+        self._cond = threading.Condition()
+    
+    def __enter__(self) -> "ConcurrencyLimiter":
+        with self._cond:
+            while self._active >= self.limit:
+                self._cond.wait()
+            self._active += 1
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        with self._cond:
+            self._active -= 1
+            self._cond.notify()
+    
+    def reduce(self, error: Optional[RateLimitError] = None) -> None:
+        """Halve the concurrency limit after a rate-limit response."""
+        with self._cond:
+            self._successes = 0
+            if self.limit > 1:
+                self.limit = max(1, self.limit // 2)
+                logger.warning(f"Rate limited by API, reducing concurrency to {self.limit}")
+    
+    def record_success(self) -> None:
+        """Count a successful call, raising a reduced limit by one after `limit` in a row."""
+        with self._cond:
+            if self.limit >= self.max_limit:
+                return
+            self._successes += 1
+            if self._successes >= self.limit:
+                self._successes = 0
+                self.limit += 1
+                logger.info(f"No rate limiting for a while, raising concurrency to {self.limit}")
+                self._cond.notify()
+
+class RateLimitPause:
+    """
+    Shared pause for concurrent workers after a 429.
+    The first worker to hit the limit sleeps for Retry-After while the others
+    block in wait(), so the pool resumes together instead of retrying in a storm.
+    """
+    
+    def __init__(self):
+        self._resume = threading.Event()
+        self._resume.set()
+        self._lock = threading.Lock()
+    
+    def wait(self) -> None:
+        """Block while a pause is in progress."""
+        self._resume.wait()
+    
+    def pause(self, seconds: Optional[float]) -> bool:
+        """
+        Pause all workers for the given number of seconds, unless already paused.
+        Returns True in the worker that started the pause, False in the others.
+        """
+        with self._lock:
+            if not self._resume.is_set():
+                return False
+            self._resume.clear()
+        
+        seconds = seconds if seconds is not None else 1.0
+        logger.warning(f"Rate limited by API, pausing all reboots for {seconds:.1f}s")
+        try:
+            shutdown_event.wait(seconds)
+        finally:
+            self._resume.set()
+        return True
+
+def reboot_aps_parallel(client: RuckusOneClient, targets: List[Tuple[str, str]],
+                        max_workers: int = 32,
+                        rate_limiter: Optional[TokenBucket] = None,
+                        max_per_venue: int = 0,
+                        start_interval: float = 0) -> Iterator[Tuple[int, bool, Optional[str]]]:
+    """
+    Reboot APs concurrently, yielding (target_index, success, error_msg) as each completes.
+    
+    Targets are (venue_id, serial_number) tuples. All workers share the client's
+    pooled session and the optional rate limiter, and pending reboots are
+    cancelled once shutdown is requested. max_per_venue caps in-flight reboots
+    within one venue, and start_interval spaces out the start of each reboot.
+    """
+    ap_module = AccessPoints(client, rate_limiter=rate_limiter)
+    limiter = ConcurrencyLimiter(max_workers)
+    pause = RateLimitPause()
+    pacer = TokenBucket(1 / start_interval, capacity=1) if start_interval > 0 else None
+    venue_limit = max_per_venue if max_per_venue > 0 else max_workers
+    
+    def worker(venue_id: str, serial_number: str) -> Tuple[bool, Optional[str]]:
+        with limiter:
+            if pacer and not pacer.acquire():
+                return False, SHUTDOWN_ERROR
+            success, error_msg = reboot_ap_with_retry(ap_module, venue_id, serial_number,
+                                                      on_rate_limit=limiter.reduce, pause=pause)
+            if success:
+                limiter.record_success()
+            return success, error_msg
+    
+    # Targets waiting to be submitted, queued per venue in target order. Venue
+    # limits are enforced here rather than in the workers, so a busy venue
+    # never ties up pool threads that other venues could use.
+    queued = {}
+    for index, (venue_id, _) in enumerate(targets):
+        queued.setdefault(venue_id, deque()).append(index)
+    in_flight = {venue_id: 0 for venue_id in queued}
+    # (next target index, venue_id) for each venue with queued targets and a free slot
+    ready = [(indexes[0], venue_id) for venue_id, indexes in queued.items()]
+    heapq.heapify(ready)
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {}
+        
+        def submit_ready() -> None:
+            # Never submit more than there are threads, so nothing waits inside the executor
+            while ready and len(futures) < max_workers:
+                _, venue_id = heapq.heappop(ready)
+                index = queued[venue_id].popleft()
+                futures[executor.submit(worker, *targets[index])] = index
+                in_flight[venue_id] += 1
+                if queued[venue_id] and in_flight[venue_id] < venue_limit:
+                    heapq.heappush(ready, (queued[venue_id][0], venue_id))
+        
+        stopping = False
+        # Submitted reboots that were still waiting to start when shutdown came
+        not_sent = 0
+        submit_ready()
+        while futures:
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+            # Reboots already in flight still report, so they reach the checkpoint log
+            if shutdown_event.is_set() and not stopping:
+                stopping = True
+                cancelled = sum(len(indexes) for indexes in queued.values())
+                ready.clear()
+                queued.clear()
+                logger.warning(f"Shutdown requested, cancelled {cancelled} pending reboots")
+            
+            for future in done:
+                index = futures.pop(future)
+                venue_id = targets[index][0]
+                in_flight[venue_id] -= 1
+                # The venue just dropped below its limit: it can take its next target again
+                if queued.get(venue_id) and in_flight[venue_id] == venue_limit - 1:
+                    heapq.heappush(ready, (queued[venue_id][0], venue_id))
+                
+                success, error_msg = future.result()
+                if error_msg == SHUTDOWN_ERROR:
+                    # Not rebooted; left out of the results so the checkpoint keeps it pending
+                    not_sent += 1
+                    continue
+                yield index, success, error_msg
+            
+            submit_ready()
+        
+        if not_sent:
+            logger.warning(f"Shutdown requested, {not_sent} reboots waiting to start were not sent")
+
+async def wait_for_shutdown(seconds: float, poll_interval: float = 0.1) -> bool:
+    """
+    Async counterpart of shutdown_event.wait(): sleep for up to `seconds`,
+    returning True as soon as shutdown is requested.
+    """
+    deadline = time.monotonic() + seconds
+    while not shutdown_event.is_set():
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        await asyncio.sleep(min(poll_interval, remaining))
+    return True
+
+async def reboot_aps_async(client: RuckusOneClient, targets: List[Tuple[str, str]],
+                           on_result: Callable[[int, bool, Optional[str]], None],
+                           max_concurrency: int = 32, max_retries: int = 3,
+                           rate_limiter: Optional[TokenBucket] = None,
+                           max_per_venue: int = 0, start_interval: float = 0) -> None:
+    """
+    Reboot APs with asyncio over a single shared httpx client.
+    
+    on_result(target_index, success, error_msg) is called from the event loop
+    as each reboot completes. Reboots not yet started when shutdown is
+    requested, or waiting to retry, are skipped and not reported.
+    max_per_venue and start_interval behave as in reboot_aps_parallel().
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    pacer = TokenBucket(1 / start_interval, capacity=1) if start_interval > 0 else None
+    venue_limit = max_per_venue if max_per_venue > 0 else max_concurrency
+    venue_slots = {venue_id: asyncio.Semaphore(venue_limit) for venue_id, _ in targets}
+    loop = asyncio.get_running_loop()
+    # Cleared while all coroutines wait out a server-requested Retry-After
+    resume = asyncio.Event()
+    resume.set()
+    
+    async with AsyncRuckusOneClient(client, max_connections=max_concurrency) as async_client:
+        async def reboot_one(index: int, venue_id: str, serial_number: str) -> None:
+            async with venue_slots[venue_id], semaphore:
+                if shutdown_event.is_set():
+                    return
+                # The pacer wait ends early on shutdown; nothing is sent after it
+                if pacer and not await loop.run_in_executor(None, pacer.acquire):
+                    return
+                if shutdown_event.is_set():
+                    return
+                
+                path = f"/venues/{venue_id}/aps/{serial_number}/systemCommands"
+                for attempt in range(max_retries):
+                    await resume.wait()
+                    if shutdown_event.is_set():
+                        return
+                    if rate_limiter and not await loop.run_in_executor(None, rate_limiter.acquire):
+                        return
+                    try:
+                        await async_client.request('PATCH', path, content=REBOOT_BODY)
+                        on_result(index, True, None)
+                        return
+                    except ResourceNotFoundError:
+                        error_msg = f"AP with serial number {serial_number} not found in venue {venue_id}"
+                    except RateLimitError as e:
+                        error_msg = str(e)
+                        if attempt < max_retries - 1 and resume.is_set():
+                            retry_after = e.retry_after if e.retry_after is not None else 1.0
+                            logger.warning(f"Rate limited by API, pausing all reboots for {retry_after:.1f}s")
+                            resume.clear()
+                            try:
+                                if await wait_for_shutdown(retry_after):
+                                    return
+                            finally:
+                                resume.set()
+                        continue
+                    except Exception as e:
+                        error_msg = str(e)
+                    
+                    if attempt < max_retries - 1:
+                        wait_time = 2 ** attempt  # Exponential backoff
+                        logger.warning(f"Reboot of {serial_number} failed (attempt {attempt + 1}/{max_retries}), retrying in {wait_time}s: {error_msg}")
+                        if await wait_for_shutdown(wait_time):
+                            return
+                
+                logger.error(f"Reboot failed after {max_retries} attempts: {error_msg}")
+                on_result(index, False, error_msg)
+        
+        await asyncio.gather(*(
+            reboot_one(index, venue_id, serial_number)
+            for index, (venue_id, serial_number) in enumerate(targets)
+        ))
+
+def prefetch_ap_status(ap_module: AccessPoints, needed_serials: set) -> Dict[str, Dict[str, Any]]:
+    """
+    Page through the tenant's APs and return the needed ones keyed by serial number.
+    Returns an empty dict if the APs could not be fetched.
+    """
+    aps = {}
+    try:
+        logger.info("Pre-fetching all APs for runtime status checking...")
+        # Fetching stops once all needed APs are found
+        # Pages after the first are fetched concurrently; cache by serial number for quick lookup
+        pages = ap_module.iter_pages(page_size=1000, max_pages=STATUS_PREFETCH_PAGES)
+        try:
+            for page_data in pages:
+                aps.update(
+                    (ap['serialNumber'], ap) for ap in page_data
+                    if ap.get('serialNumber') in needed_serials
+                )
+                if len(aps) == len(needed_serials):
+                    break
+        finally:
+            pages.close()
+        logger.info(f"Cached {len(aps)} APs for status checking")
+    except Exception as e:
+        logger.warning(f"Could not pre-fetch APs for status checking: {e}")
+        logger.info("Will use CSV status for all APs")
+        return {}
+    return aps
+
+class LazyStatusCache:
+    """
+    Serial number to AP lookup that queries each AP the first time it is checked.
+    Stands in for the pre-fetched AP dict when only a few APs are imported.
+    If a lookup fails, falls back to pre-fetching all needed APs.
+    """
+    
+    def __init__(self, ap_module: AccessPoints, needed_serials: set):
+        self.ap_module = ap_module
+        self.needed_serials = needed_serials
+        self._aps = {}
+        self._fallback = None
+    
+    def _lookup(self, serial_number: str) -> Optional[Dict[str, Any]]:
+        if self._fallback is not None:
+            return self._fallback.get(serial_number)
+        if serial_number not in self._aps:
+            try:
+                ap = self.ap_module.get(serial_number)
+            except Exception as e:
+                logger.warning(f"Per-AP status lookup failed for {serial_number}: {e}")
+                logger.info("Switching to pre-fetching APs for status checking")
+                self._fallback = prefetch_ap_status(self.ap_module, self.needed_serials)
+                return self._fallback.get(serial_number)
+            if ap is None:
+                logger.warning(f"AP {serial_number} not found by status lookup, using CSV status")
+            self._aps[serial_number] = ap
+        return self._aps[serial_number]
+    
+    def __contains__(self, serial_number: str) -> bool:
+        return self._lookup(serial_number) is not None
+    
+    def __getitem__(self, serial_number: str) -> Dict[str, Any]:
+        ap = self._lookup(serial_number)
+        if ap is None:
+            raise KeyError(serial_number)
+        return ap
+
 def import_and_reboot(client: RuckusOneClient, csv_file: str, delay: int = 2,
                      simulate: bool = False, force: bool = False, 
                      resume: bool = False, batch_size: int = 50,
-                     skip_status_check: bool = False) -> Dict[str, Any]:
-    """Import CSV and reboot APs with delay."""
+                     skip_status_check: bool = False, max_workers: int = 1,
+                     max_rate: Optional[float] = None, use_async: bool = False,
+                     bulk: bool = False, max_per_venue: int = 0) -> Dict[str, Any]:
+    """
+    Import CSV and reboot APs with delay, or concurrently when max_workers > 1.
+    Concurrent reboots start delay / max_workers seconds apart.
+    """
     if not os.path.exists(csv_file):
         raise FileNotFoundError(f"CSV file not found: {csv_file}")
     
-    # Initialize modules
-    ap_module = AccessPoints(client)
-    
-    # Read CSV to get AP count
-    aps_to_process = []
-    with open(csv_file, 'r') as csvfile:
-        reader = csv.DictReader(csvfile)
-        for row in reader:
-            aps_to_process.append(row)
+    # Initialize modules, sharing one rate limiter across all AP calls
+    rate_limiter = TokenBucket(max_rate) if max_rate else None
+    ap_module = AccessPoints(client, rate_limiter=rate_limiter)
     
-    total_aps = len(aps_to_process)
+    # Scan the CSV up front for the AP count; rows are read again lazily as they are processed
+    csv_serials = scan_reboot_csv(csv_file)
+    total_aps = len(csv_serials)
     
     if total_aps == 0:
         logger.warning("No APs found in CSV file")
@@ -619,21 +1761,35 @@ def import_and_reboot(client: RuckusOneClient, csv_file: str, delay: int = 2,
     
     # Checkpoint handling
     checkpoint_file = f".checkpoint_{Path(csv_file).stem}.json"
+    checkpoint_log_file = f".checkpoint_{Path(csv_file).stem}.log"
     checkpoint_data = {}
     start_index = 0
+    # Serials rebooted by the interrupted run, including any after its last checkpoint
+    logged_serials = []
     
     if resume:
         checkpoint_data = load_checkpoint(checkpoint_file)
         start_index = checkpoint_data.get('last_processed_index', 0)
+        logged_serials = CheckpointLog.load(checkpoint_log_file)
         if start_index > 0:
             logger.info(f"Resuming from AP {start_index + 1}/{total_aps}")
+        if logged_serials:
+            logger.info(f"Checkpoint log lists {len(logged_serials)} APs already rebooted")
+    completed_serials = set(logged_serials)
+    
+    mode_str = "SIMULATE MODE" if simulate else "LIVE MODE"
+    parallel = (max_workers > 1 or use_async or bulk) and not simulate
     
-    # Calculate estimated time
+    # Calculate estimated time; concurrent reboots (bulk batches included)
+    # start delay / max_workers seconds apart on average
     estimated_time = (total_aps - start_index) * delay
+    if parallel:
+        estimated_time /= max_workers
     estimated_completion = datetime.now() + timedelta(seconds=estimated_time)
-    
-    mode_str = "SIMULATE MODE" if simulate else "LIVE MODE"
-    logger.info(f"{mode_str}: Processing {total_aps - start_index} APs with {delay}s delay")
+    if parallel:
+        logger.info(f"{mode_str}: Processing {total_aps - start_index} APs with up to {max_workers} concurrent reboots")
+    else:
+        logger.info(f"{mode_str}: Processing {total_aps - start_index} APs with {delay}s delay")
     logger.info(f"Estimated completion time: {estimated_completion.strftime('%Y-%m-%d %H:%M:%S')}")
     
     if not simulate and not skip_status_check:
@@ -647,52 +1803,45 @@ def import_and_reboot(client: RuckusOneClient, csv_file: str, delay: int = 2,
     stats = {
         'total': total_aps,
         'processed': start_index,
-        'success': checkpoint_data.get('success', 0),
+        'success': max(checkpoint_data.get('success', 0), len(logged_serials)),
         'failed': checkpoint_data.get('failed', 0),
+        'skipped': 0,
+        'success_aps': [],
+        'skipped_aps': [],
         'failed_aps': checkpoint_data.get('failed_aps', [])
     }
     
+    checkpoint_log = CheckpointLog(checkpoint_log_file, truncate=not resume) if not simulate else None
+    
     # Pre-fetch and cache all APs for status checking (unless skipping or simulating)
     all_aps_cache = {}
-    if not simulate and not skip_status_check:
-        try:
-            logger.info("Pre-fetching all APs for runtime status checking...")
-            query_data = {
-                "pageSize": 1000,
-                "page": 0,
-                "sortOrder": "ASC"
-            }
-            result = ap_module.list(query_data)
-            all_current_aps = result.get('data', [])
-            
-            # Cache by serial number for quick lookup
-            all_aps_cache = {
-                ap.get('serialNumber'): ap for ap in all_current_aps if ap.get('serialNumber')
-            }
-            logger.info(f"Cached {len(all_aps_cache)} APs for status checking")
-            
-            # Handle pagination if there are more APs
-            pagination = result.get('pagination', {})
-            total_pages = pagination.get('totalPages', 1)
-            if total_pages > 1:
-                logger.info(f"Fetching additional {total_pages - 1} pages of APs...")
-                for page in range(1, min(total_pages, 10)):  # Limit to 10 pages max
-                    query_data['page'] = page
-                    result = ap_module.list(query_data)
-                    page_aps = result.get('data', [])
-                    for ap in page_aps:
-                        if ap.get('serialNumber'):
-                            all_aps_cache[ap.get('serialNumber')] = ap
-                logger.info(f"Total cached APs: {len(all_aps_cache)}")
-        except Exception as e:
-            logger.warning(f"Could not pre-fetch APs for status checking: {e}")
-            logger.info("Will use CSV status for all APs")
+    # Only APs still to be processed are looked up
+    needed_serials = set(csv_serials[start_index:]) - completed_serials
+    if not simulate and not skip_status_check and not parallel and len(needed_serials) <= LAZY_STATUS_MAX_APS:
+        # Few APs, one at a time: query each just before it is processed rather than paging the tenant
+        logger.info("Fetching runtime status for each AP as it is processed")
+        all_aps_cache = LazyStatusCache(ap_module, needed_serials)
+    elif not simulate and not skip_status_check:
+        all_aps_cache = prefetch_ap_status(ap_module, needed_serials)
     
     start_time = time.time()
-    
-    # Process APs
-    for i in range(start_index, total_aps):
-        if shutdown_requested:
+    # Periodic checkpoints are skipped within CHECKPOINT_MIN_INTERVAL of the last one;
+    # the checkpoint log still records every completed reboot in between
+    last_checkpoint = time.monotonic()
+    
+    # Reboots deferred to the parallel driver: (index, ap_name, venue_id, serial_number)
+    pending_reboots = []
+    stop_index = total_aps
+    
+    # Process APs, reading CSV rows as they are reached
+    csv_rows = itertools.islice(iter_reboot_csv(csv_file), start_index, None)
+    for i, ap in enumerate(csv_rows, start=start_index):
+        if shutdown_event.is_set() and parallel:
+            # Checkpoint is written after the deferred reboots below
+            stop_index = i
+            break
+        
+        if shutdown_event.is_set():
             logger.warning("Shutdown requested, saving checkpoint...")
             checkpoint_data = {
                 'last_processed_index': i,
@@ -704,16 +1853,20 @@ def import_and_reboot(client: RuckusOneClient, csv_file: str, delay: int = 2,
             logger.info(f"Checkpoint saved. Resume with --resume flag")
             break
         
-        ap = aps_to_process[i]
         serial_number = ap.get('serial_number', '')
         venue_id = ap.get('venue_id', '')
         ap_name = ap.get('name', 'Unknown')
         csv_status = ap.get('status', '')
         
+        if serial_number in completed_serials:
+            logger.debug("AP %s already rebooted before interruption, skipping", serial_number)
+            stats['processed'] += 1
+            continue
+        
         # Progress indicator with colors
         progress_pct = ((i + 1) / total_aps) * 100
-        ap_info = colored(ap_name, 'CYAN', bold=True) + ' (SN: ' + colored(serial_number, 'YELLOW') + ')'
-        logger.info(f"[{i + 1}/{total_aps}] ({progress_pct:.1f}%) Processing AP: {ap_info}")
+        logger.info("[%d/%d] (%.1f%%) Processing AP: %s (SN: %s)", i + 1, total_aps, progress_pct,
+                    colored(ap_name, 'CYAN', bold=True), colored(serial_number, 'YELLOW'))
         
         # Get current AP status from pre-fetched cache
         current_status = csv_status  # Default to CSV status
@@ -722,67 +1875,61 @@ def import_and_reboot(client: RuckusOneClient, csv_file: str, delay: int = 2,
                 cached_ap = all_aps_cache[serial_number]
                 current_status = cached_ap.get('status', csv_status)
                 if current_status != csv_status:
-                    logger.info(f"  Status update: {colored(csv_status, 'YELLOW')} → {colored(current_status, 'CYAN')}")
+                    logger.info("  Status update: %s → %s", colored(csv_status, 'YELLOW'), colored(current_status, 'CYAN'))
             else:
-                logger.debug(f"  AP {serial_number} not found in cache, using CSV status: {csv_status}")
+                logger.debug("  AP %s not found in cache, using CSV status: %s", serial_number, csv_status)
         
         # Check if AP is operational
-        is_operational = 'Operational' in current_status or current_status.startswith('2_')
+        is_operational = is_operational_status(current_status)
         
         if not is_operational:
-            skip_msg = f"Skipping AP {colored(ap_name, 'YELLOW')} - Status: {colored(current_status, 'RED')} (not operational)"
-            logger.warning(skip_msg)
-            if 'skipped_aps' not in stats:
-                stats['skipped_aps'] = []
+            logger.warning("Skipping AP %s - Status: %s (not operational)",
+                           colored(ap_name, 'YELLOW'), colored(current_status, 'RED'))
             stats['skipped_aps'].append({
                 'serial_number': serial_number,
                 'name': ap_name,
                 'status': current_status,
                 'venue_id': venue_id
             })
-            stats['skipped'] = stats.get('skipped', 0) + 1
+            stats['skipped'] += 1
             continue
         
         if simulate:
-            logger.info(f"SIMULATE: Would reboot AP {colored(serial_number, 'YELLOW')} in venue {venue_id}")
-            logger.info(f"SIMULATE: API call: PATCH /venues/{venue_id}/aps/{serial_number}/systemCommands with body: {{'type': 'REBOOT'}}")
+            logger.info("SIMULATE: Would reboot AP %s in venue %s", colored(serial_number, 'YELLOW'), venue_id)
+            logger.info("SIMULATE: API call: PATCH /venues/%s/aps/%s/systemCommands with body: {'type': 'REBOOT'}",
+                        venue_id, serial_number)
             stats['success'] += 1
-            if 'success_aps' not in stats:
-                stats['success_aps'] = []
             stats['success_aps'].append({
                 'serial_number': serial_number,
                 'name': ap_name,
                 'venue_id': venue_id
             })
+        elif parallel:
+            pending_reboots.append((i, ap_name, venue_id, serial_number))
+            continue
         else:
             # Actual reboot
             success, error_msg = reboot_ap_with_retry(ap_module, venue_id, serial_number)
-            
+            if error_msg == SHUTDOWN_ERROR:
+                logger.warning("Shutdown requested, saving checkpoint...")
+                checkpoint_data = {
+                    'last_processed_index': i,
+                    'success': stats['success'],
+                    'failed': stats['failed'],
+                    'failed_aps': stats['failed_aps']
+                }
+                save_checkpoint(checkpoint_file, checkpoint_data)
+                logger.info(f"Checkpoint saved. Resume with --resume flag")
+                break
+            record_reboot_result(stats, ap_name, serial_number, venue_id, success, error_msg)
             if success:
-                success_msg = f"Successfully initiated reboot for AP {colored(serial_number, 'GREEN')}"
-                logger.info(success_msg)
-                stats['success'] += 1
-                if 'success_aps' not in stats:
-                    stats['success_aps'] = []
-                stats['success_aps'].append({
-                    'serial_number': serial_number,
-                    'name': ap_name,
-                    'venue_id': venue_id
-                })
-            else:
-                error_info = f"Failed to reboot AP {colored(serial_number, 'RED')}: {error_msg}"
-                logger.error(error_info)
-                stats['failed'] += 1
-                stats['failed_aps'].append({
-                    'serial_number': serial_number,
-                    'name': ap_name,
-                    'error': error_msg
-                })
+                checkpoint_log.record(serial_number)
         
         stats['processed'] += 1
         
         # Save checkpoint periodically
-        if (i + 1) % batch_size == 0:
+        if (i + 1) % batch_size == 0 and time.monotonic() - last_checkpoint >= CHECKPOINT_MIN_INTERVAL:
+            last_checkpoint = time.monotonic()
             checkpoint_data = {
                 'last_processed_index': i + 1,
                 'success': stats['success'],
@@ -790,16 +1937,117 @@ def import_and_reboot(client: RuckusOneClient, csv_file: str, delay: int = 2,
                 'failed_aps': stats['failed_aps']
             }
             save_checkpoint(checkpoint_file, checkpoint_data)
-            logger.debug(f"Checkpoint saved at AP {i + 1}")
+            logger.debug("Checkpoint saved at AP %d", i + 1)
         
         # Apply delay if not the last AP
         if i < total_aps - 1:
             countdown_with_dots(delay, f"Waiting {delay}s before next AP")
     
-    # Clean up checkpoint if completed
-    if stats['processed'] == total_aps and os.path.exists(checkpoint_file):
-        os.remove(checkpoint_file)
-        logger.info("Operation completed, checkpoint file removed")
+    if pending_reboots:
+        # Spread the sequential delay across the workers so reboots stay staggered
+        start_interval = delay / max_workers if delay > 0 else 0
+        logger.info(f"Rebooting {len(pending_reboots)} APs with up to {max_workers} concurrent requests, "
+                    f"starting one every {start_interval:.2f}s...")
+        targets = [(venue_id, serial_number) for _, _, venue_id, serial_number in pending_reboots]
+        completed = set()
+        # Number of leading pending reboots that have all completed, and when it was last saved
+        progress = {'watermark': 0, 'saved_at': last_checkpoint}
+        
+        def reboot_checkpoint() -> Dict[str, Any]:
+            watermark = progress['watermark']
+            resume_index = pending_reboots[watermark][0] if watermark < len(pending_reboots) else stop_index
+            return {
+                'last_processed_index': resume_index,
+                'success': stats['success'],
+                'failed': stats['failed'],
+                'failed_aps': stats['failed_aps']
+            }
+        
+        def handle_result(target_index: int, success: bool, error_msg: Optional[str]):
+            _, ap_name, venue_id, serial_number = pending_reboots[target_index]
+            record_reboot_result(stats, ap_name, serial_number, venue_id, success, error_msg)
+            if success:
+                checkpoint_log.record(serial_number)
+            stats['processed'] += 1
+            
+            completed.add(target_index)
+            while progress['watermark'] in completed:
+                progress['watermark'] += 1
+            
+            if (len(completed) % batch_size == 0
+                    and time.monotonic() - progress['saved_at'] >= CHECKPOINT_MIN_INTERVAL):
+                progress['saved_at'] = time.monotonic()
+                save_checkpoint(checkpoint_file, reboot_checkpoint())
+                logger.debug("Checkpoint saved after %d concurrent reboots", len(completed))
+        
+        # Indexes into pending_reboots still to be rebooted one AP per request
+        remaining = list(range(len(pending_reboots)))
+        
+        if bulk:
+            by_venue = {}
+            for target_index, (venue_id, _) in enumerate(targets):
+                by_venue.setdefault(venue_id, []).append(target_index)
+            
+            # --max-per-venue caps how many APs of a venue one request reboots
+            bulk_size = min(BULK_REBOOT_SIZE, max_per_venue) if max_per_venue > 0 else BULK_REBOOT_SIZE
+            next_start = time.monotonic()
+            remaining = []
+            for venue_id, indices in by_venue.items():
+                for start in range(0, len(indices), bulk_size):
+                    batch = indices[start:start + bulk_size]
+                    # Keep the per-AP pace: a batch of N APs counts as N reboots start_interval apart
+                    if shutdown_event.wait(max(0, next_start - time.monotonic())):
+                        break
+                    next_start = time.monotonic() + len(batch) * start_interval
+                    try:
+                        accepted = ap_module.reboot_many(venue_id, [targets[i][1] for i in batch])
+                    except Exception as e:
+                        logger.warning(f"Bulk reboot failed for venue {venue_id}, retrying per AP: {e}")
+                        accepted = False
+                    
+                    if accepted:
+                        for target_index in batch:
+                            handle_result(target_index, True, None)
+                    else:
+                        remaining.extend(batch)
+            remaining.sort()
+        
+        if remaining and not shutdown_event.is_set():
+            remaining_targets = [targets[i] for i in remaining]
+            if use_async:
+                asyncio.run(reboot_aps_async(
+                    client, remaining_targets,
+                    lambda n, success, error_msg: handle_result(remaining[n], success, error_msg),
+                    max_concurrency=max_workers, rate_limiter=rate_limiter,
+                    max_per_venue=max_per_venue, start_interval=start_interval))
+            else:
+                for n, success, error_msg in reboot_aps_parallel(
+                        client, remaining_targets, max_workers=max_workers, rate_limiter=rate_limiter,
+                        max_per_venue=max_per_venue, start_interval=start_interval):
+                    handle_result(remaining[n], success, error_msg)
+        
+        if shutdown_event.is_set():
+            save_checkpoint(checkpoint_file, reboot_checkpoint())
+            logger.info(f"Checkpoint saved. Resume with --resume flag")
+    elif shutdown_event.is_set() and parallel:
+        save_checkpoint(checkpoint_file, {
+            'last_processed_index': stop_index,
+            'success': stats['success'],
+            'failed': stats['failed'],
+            'failed_aps': stats['failed_aps']
+        })
+        logger.info(f"Checkpoint saved. Resume with --resume flag")
+    
+    if checkpoint_log:
+        checkpoint_log.close()
+    
+    # Clean up checkpoint if completed; skipped APs are not counted as processed
+    if stats['processed'] + stats['skipped'] == total_aps:
+        if os.path.exists(checkpoint_log_file):
+            os.remove(checkpoint_log_file)
+        if os.path.exists(checkpoint_file):
+            os.remove(checkpoint_file)
+            logger.info("Operation completed, checkpoint file removed")
     
     # Calculate statistics
     elapsed_time = time.time() - start_time
@@ -814,38 +2062,54 @@ def import_and_reboot(client: RuckusOneClient, csv_file: str, delay: int = 2,
     logger.info(f"APs processed: {stats['processed']}")
     logger.info(f"Successful reboots: {colored(str(stats['success']), 'GREEN')}")
     logger.info(f"Failed reboots: {colored(str(stats['failed']), 'RED' if stats['failed'] > 0 else 'GREEN')}")
-    logger.info(f"Skipped (not operational): {colored(str(stats.get('skipped', 0)), 'YELLOW')}")
+    logger.info(f"Skipped (not operational): {colored(str(stats['skipped']), 'YELLOW')}")
     logger.info(f"Time taken: {elapsed_time:.2f} seconds")
     logger.info(f"Average time per AP: {avg_time_per_ap:.2f} seconds")
     
+    # Each table is logged as a single multi-line record
     # Table of successfully rebooted APs
     if stats.get('success_aps'):
-        logger.info("\n" + colored("SUCCESSFULLY REBOOTED APs", 'GREEN', bold=True))
-        logger.info("-" * 80)
-        logger.info(f"{'AP Name':<30} {'Serial Number':<20} {'Venue ID':<36}")
-        logger.info("-" * 80)
-        for ap in stats.get('success_aps', []):
-            logger.info(f"{ap['name']:<30} {ap['serial_number']:<20} {ap['venue_id']:<36}")
+        lines = [
+            "\n" + colored("SUCCESSFULLY REBOOTED APs", 'GREEN', bold=True),
+            "-" * 80,
+            f"{'AP Name':<30} {'Serial Number':<20} {'Venue ID':<36}",
+            "-" * 80
+        ]
+        lines.extend(
+            f"{ap['name']:<30} {ap['serial_number']:<20} {ap['venue_id']:<36}"
+            for ap in stats['success_aps']
+        )
+        logger.info("\n".join(lines))
     
     # Table of skipped APs
     if stats.get('skipped_aps'):
-        logger.info("\n" + colored("SKIPPED APs (NOT OPERATIONAL)", 'YELLOW', bold=True))
-        logger.info("-" * 80)
-        logger.info(f"{'AP Name':<25} {'Serial Number':<20} {'Status':<35}")
-        logger.info("-" * 80)
-        for ap in stats.get('skipped_aps', []):
-            status_colored = colored(ap['status'], 'RED')
-            logger.info(f"{ap['name']:<25} {ap['serial_number']:<20} {status_colored:<35}")
+        lines = [
+            "\n" + colored("SKIPPED APs (NOT OPERATIONAL)", 'YELLOW', bold=True),
+            "-" * 80,
+            f"{'AP Name':<25} {'Serial Number':<20} {'Status':<35}",
+            "-" * 80
+        ]
+        # Same output as colored(status, 'RED'), with the escape codes looked up once
+        red, reset = (COLOR_PREFIXES[('RED', False)], COLORS['RESET']) if COLOR_OUTPUT else ('', '')
+        lines.extend(
+            f"{ap['name']:<25} {ap['serial_number']:<20} {red + ap['status'] + reset:<35}"
+            for ap in stats['skipped_aps']
+        )
+        logger.info("\n".join(lines))
     
     # Table of failed APs
     if stats.get('failed_aps'):
-        logger.info("\n" + colored("FAILED APs", 'RED', bold=True))
-        logger.info("-" * 80)
-        logger.info(f"{'AP Name':<25} {'Serial Number':<20} {'Error':<35}")
-        logger.info("-" * 80)
-        for ap in stats.get('failed_aps', []):
-            error_short = ap['error'][:35] if len(ap['error']) > 35 else ap['error']
-            logger.info(f"{ap['name']:<25} {ap['serial_number']:<20} {error_short:<35}")
+        lines = [
+            "\n" + colored("FAILED APs", 'RED', bold=True),
+            "-" * 80,
+            f"{'AP Name':<25} {'Serial Number':<20} {'Error':<35}",
+            "-" * 80
+        ]
+        lines.extend(
+            f"{ap['name']:<25} {ap['serial_number']:<20} {ap['error'][:35]:<35}"
+            for ap in stats['failed_aps']
+        )
+        logger.info("\n".join(lines))
     
     return stats
 
@@ -912,6 +2176,22 @@ Workflow:
                        help='Number of APs to process before saving checkpoint (default: 50)')
     parser.add_argument('--skip-status-check', action='store_true',
                        help='Skip runtime status verification and trust CSV status (faster, less safe)')
+    parser.add_argument('--max-concurrency', '--concurrency', type=int, default=1,
+                       help='Number of APs to reboot concurrently (default: 1, sequential with --delay)')
+    parser.add_argument('--max-per-venue', type=int, default=0,
+                       help='Maximum concurrent reboots within one venue, 0 for no limit (default: 0)')
+    parser.add_argument('--max-rate', type=float, default=10.0,
+                       help='Maximum AP API requests per second, 0 to disable (default: 10)')
+    parser.add_argument('--async', dest='use_async', action='store_true',
+                       help='Send concurrent reboots with asyncio over HTTP/2 (requires httpx[http2])')
+    parser.add_argument('--cache', action='store_true',
+                       help=f'Cache venue/AP query responses in {RESPONSE_CACHE_DIR} and revalidate with ETags')
+    parser.add_argument('--bulk', action='store_true',
+                       help='Reboot APs with bulk requests per venue where the API supports it, '
+                            'falling back to concurrent per-AP reboots; batches are capped by '
+                            '--max-per-venue and paced by --delay')
+    parser.add_argument('--no-token-cache', action='store_true',
+                       help=f'Do not read or write the cached access token ({TOKEN_CACHE_PATH})')
     
     args = parser.parse_args()
     
@@ -922,6 +2202,18 @@ Workflow:
     if args.export and args.import_file:
         parser.error("Cannot use --export and --import together")
     
+    if args.use_async and httpx is None:
+        parser.error("--async requires httpx: pip install 'httpx[http2]'")
+    
+    if args.max_concurrency < 1:
+        parser.error("--max-concurrency must be at least 1")
+    
+    if args.max_per_venue < 0:
+        parser.error("--max-per-venue cannot be negative")
+    
+    if args.max_rate < 0:
+        parser.error("--max-rate cannot be negative")
+    
     # Set up logging
     setup_logging(args.log_level, args.log_file)
     
@@ -935,31 +2227,39 @@ Workflow:
             client_id=config['client_id'],
             client_secret=config['client_secret'],
             tenant_id=config['tenant_id'],
-            region=config.get('region', 'na')
+            region=config.get('region', 'na'),
+            token_cache_path=None if args.no_token_cache else TOKEN_CACHE_PATH,
+            response_cache_dir=RESPONSE_CACHE_DIR if args.cache else None
         )
         
         # Execute requested operation
-        if args.export:
-            output_file = export_aps_to_csv(client, args.output)
-            if output_file:
-                print(f"\nExport completed: {output_file}")
-        
-        elif args.import_file:
-            stats = import_and_reboot(
-                client,
-                args.import_file,
-                delay=args.delay,
-                simulate=args.simulate,
-                force=args.force,
-                resume=args.resume,
-                batch_size=args.batch_size,
-                skip_status_check=args.skip_status_check
-            )
+        with client:
+            if args.export:
+                output_file = export_aps_to_csv(client, args.output)
+                if output_file:
+                    print(f"\nExport completed: {output_file}")
             
-            if stats and not shutdown_requested:
-                print(f"\nOperation completed successfully")
-            elif shutdown_requested:
-                print(f"\nOperation interrupted. Use --resume to continue")
+            elif args.import_file:
+                stats = import_and_reboot(
+                    client,
+                    args.import_file,
+                    delay=args.delay,
+                    simulate=args.simulate,
+                    force=args.force,
+                    resume=args.resume,
+                    batch_size=args.batch_size,
+                    skip_status_check=args.skip_status_check,
+                    max_workers=args.max_concurrency,
+                    max_rate=args.max_rate,
+                    use_async=args.use_async,
+                    bulk=args.bulk,
+                    max_per_venue=args.max_per_venue
+                )
+                
+                if stats and not shutdown_event.is_set():
+                    print(f"\nOperation completed successfully")
+                elif shutdown_event.is_set():
+                    print(f"\nOperation interrupted. Use --resume to continue")
     
     except FileNotFoundError as e:
         logger.error(f"File not found: {e}")